@@ -38,6 +38,28 @@ st.markdown(
 # 공통 축 범위 (scale 고정하여 도형이 찌그러지지 않도록 함)
 AX_RANGE = 6  # 축 범위: -AX_RANGE .. AX_RANGE
 
+# 공통 축/여백 설정 (plot_shape에서 매번 새로 만들지 않고 그대로 넘김)
+_XAX = dict(range=[-AX_RANGE, AX_RANGE], zeroline=False, showgrid=False)
+_YAX = dict(_XAX, scaleanchor="x")
+_MARGIN = dict(l=10, r=10, t=10, b=10)
+
+# 사각형의 족보 설명 버튼 (버튼 이름 → 설명)
+EXPLANATIONS = {
+    "사다리꼴 설명 🟩": "사다리꼴은 한 쌍의 마주보는 변만 평행해요. 모든 평행사변형은 사다리꼴이 될 수 있어요.",
+    "평행사변형 설명 🔷": "평행사변형은 마주보는 두 쌍의 변이 모두 평행해요. 이 성질 때문에 조금 더 규칙적인 모양이에요.",
+    "직사각형/마름모 설명 🔶": "직사각형은 네 각이 모두 90°인 평행사변형이에요. 마름모는 네 변의 길이가 모두 같은 평행사변형이에요.",
+    "정사각형 설명 ✨": "정사각형은 네 변의 길이가 모두 같고, 네 각이 모두 직각인 도형이에요. 그래서 직사각형이면서 마름모이기도 해요!",
+}
+
+# OX 퀴즈 문제 (문제, 정답, 힌트) — 재실행마다 다시 만들지 않도록 모듈 상수로 둠
+OX_QS = (
+    ("정사각형은 항상 직사각형이다.", True, "정사각형은 네 각이 모두 직각이므로 직사각형이에요."),
+    ("모든 평행사변형은 사다리꼴이다.", True, "사다리꼴은 한 쌍만 평행해도 되므로, 평행사변형은 사다리꼴의 일종이에요."),
+    ("모든 마름모는 직사각형이다.", False, "마름모는 네 변의 길이가 같지만 각이 직각일 필요는 없어요."),
+)
+# 문제별 중복 제출 방지 플래그 키 (answered_1, answered_2, ...)
+_OX_KEYS = tuple(f"answered_{i}" for i in range(1, len(OX_QS) + 1))
+
 
 # --------------------------------------------------
 # 유틸리티 함수들
@@ -45,75 +67,173 @@ AX_RANGE = 6  # 축 범위: -AX_RANGE .. AX_RANGE
 
 def plot_shape(fig):
     """Plotly Figure에 축 비율과 레이아웃을 고정해주는 공통 설정"""
-    fig.update_xaxes(range=[-AX_RANGE, AX_RANGE], zeroline=False, showgrid=False)
-    fig.update_yaxes(range=[-AX_RANGE, AX_RANGE], zeroline=False, showgrid=False, scaleanchor="x")
-    fig.update_layout(width=600, height=600, margin=dict(l=10, r=10, t=10, b=10))
+    fig.update_xaxes(**_XAX)
+    fig.update_yaxes(**_YAX)
+    fig.update_layout(width=600, height=600, margin=_MARGIN)
     return fig
 
 
+# 좌표 계산 함수는 st.cache_data로 입력값별 결과를 기억해 두어
+# 슬라이더를 움직일 때마다 같은 계산을 반복하지 않아요.
+@st.cache_data(max_entries=256)
 def draw_triangle(base, alpha_deg, beta_deg):
     """
     기하 계산을 이용해 삼각형 좌표를 계산
     - base: 밑변 길이 (AB)
     - alpha_deg: A에서의 각도(도)
     - beta_deg: B에서의 각도(도)
-    반환: [(x1,y1),(x2,y2),(x3,y3)]
+    반환: (3, 2) 모양의 np.ndarray [[x1,y1],[x2,y2],[x3,y3]]
     """
-    # 각도를 라디안으로 변환
-    alpha = math.radians(alpha_deg)
-    beta = math.radians(beta_deg)
-    gamma = math.radians(180 - alpha_deg - beta_deg)
-
-    # 삼각형이 성립하지 않으면 None 반환
-    if gamma <= 0:
+    # 삼각형이 성립하지 않으면 삼각함수 계산 전에 바로 None 반환
+    if alpha_deg + beta_deg >= 180:
         return None
 
+    # 세 각도를 한 번에 라디안으로 변환하고 sin 값도 한 번에 계산
+    angles = np.radians([alpha_deg, beta_deg, 180 - alpha_deg - beta_deg])
+    sin_a, sin_b, sin_c = np.sin(angles)
+    cos_a = math.cos(angles[0])
+
     # 법칙: a/sin(A) = b/sin(B) = c/sin(C) = 2R
     c = base
-    s = c / math.sin(gamma)
+    s = c / sin_c
     # a: BC (opp A), b: AC (opp B)
-    a = s * math.sin(alpha)
-    b = s * math.sin(beta)
+    a = s * sin_a
+    b = s * sin_b
 
     # 좌표: A=(0,0), B=(c,0), C는 A로부터 길이 b, 각도 alpha
     A = (0.0, 0.0)
     B = (c, 0.0)
-    C = (b * math.cos(alpha), b * math.sin(alpha))
-    return [A, B, C]
+    C = (b * cos_a, b * sin_a)
+    return np.array([A, B, C])
 
 
+@st.cache_data(max_entries=256)
 def draw_parallelogram(width, height, angle_deg):
     """
     평행사변형(또는 직사각형/마름모로 변형 가능)의 좌표 계산
     - width: 밑변 길이
     - height: 높이 (수직 거리)
     - angle_deg: 밑 변과 옆 변의 기울기 각도 (도) — 0이면 직사각형
+    반환: (4, 2) 모양의 np.ndarray
     """
-    angle = math.radians(angle_deg)
     A = (0.0, 0.0)
     B = (width, 0.0)
-    # 평행이동 벡터: (dx, height)
-    dx = height / math.tan(angle) if abs(math.tan(angle)) > 1e-6 else 0.0
+    # 평행이동 벡터: (dx, height) — tan은 한 번만 계산해서 검사와 나눗셈에 같이 씀
+    t = math.tan(math.radians(angle_deg))
+    dx = height / t if abs(t) > 1e-6 else 0.0
     D = (dx, height)
     C = (width + dx, height)
-    return [A, B, C, D]
+    return np.array([A, B, C, D])
 
 
+@st.cache_data(max_entries=256)
 def draw_rectangle(width, height):
-    """직사각형 좌표 계산"""
+    """직사각형 좌표 계산 (반환: (4, 2) 모양의 np.ndarray)"""
     A = (0.0, 0.0)
     B = (width, 0.0)
     C = (width, height)
     D = (0.0, height)
-    return [A, B, C, D]
+    return np.array([A, B, C, D])
 
 
+@st.cache_data(max_entries=256)
 def draw_circle(radius, num_points=80):
-    """원 좌표를 폴리라인으로 반환"""
+    """원 좌표를 폴리라인으로 반환 (화면에는 add_circle의 원 도형을 쓰고, 계산용으로 남겨 둠)"""
+    # 호출될 때만 단위원을 계산 (같은 입력은 st.cache_data가 기억함)
     thetas = np.linspace(0, 2 * math.pi, num_points)
-    xs = radius * np.cos(thetas)
-    ys = radius * np.sin(thetas)
-    return xs, ys
+    return radius * np.cos(thetas), radius * np.sin(thetas)
+
+
+def close_polyline(pts):
+    """(N, 2) 좌표 배열의 첫 점을 끝에 붙여 닫힌 도형의 xs, ys 배열로 반환"""
+    closed = np.vstack([pts, pts[:1]])
+    return closed[:, 0], closed[:, 1]
+
+
+def add_circle(fig, radius, color, width):
+    """원점 중심 원을 Plotly 도형으로 추가 (폴리라인 대신 외접 사각형 좌표 4개만 전송)"""
+    fig.add_shape(type="circle", xref="x", yref="y", x0=-radius, y0=-radius, x1=radius, y1=radius,
+                  line=dict(color=color, width=width))
+    return fig
+
+
+def get_explore_fig():
+    """
+    탭1(도형 탐험)에서 재사용하는 Figure를 세션 상태에서 가져옴
+    - 처음 한 번만 삼각형/사각형/원 중심 트레이스를 만들어 두고
+      이후에는 보이는 트레이스의 좌표만 바꿔서 사용 (원 자체는 add_circle 도형)
+    """
+    if 'tab1_fig' not in st.session_state:
+        fig = go.Figure(
+            data=[
+                go.Scatter(mode="lines+markers", fill="toself", name="triangle",
+                           marker=dict(size=8, color="royalblue"), line=dict(color="royalblue", width=3)),
+                go.Scatter(mode="lines+markers", fill="toself", name="quad",
+                           marker=dict(size=8), line=dict(width=3)),
+                go.Scatter(mode="markers", name="center", marker=dict(size=8, color="crimson")),
+            ],
+        )
+        # 숨겨진 트레이스가 범례에 섞이지 않도록 범례는 끔
+        fig.layout.showlegend = False
+        # 공통 레이아웃은 세션 Figure를 만들 때 한 번만 적용
+        st.session_state['tab1_fig'] = plot_shape(fig)
+    return st.session_state['tab1_fig']
+
+
+@st.cache_resource
+def build_genealogy_fig():
+    """사각형의 족보 다이어그램 (내용이 고정되어 있어 프로세스당 한 번만 생성)"""
+    fig2 = go.Figure()
+    # 네모 박스 위치 지정 (x, y 중앙)
+    nodes = {
+        "사다리꼴": (0, 2),
+        "평행사변형": (0, 1),
+        "직사각형": (-1, 0),
+        "마름모": (1, 0),
+        "정사각형": (0, -1),
+    }
+
+    # 박스와 텍스트 추가 (다섯 개 노드를 하나의 WebGL 트레이스로 한 번에 그림)
+    xs = [p[0] for p in nodes.values()]
+    ys = [p[1] for p in nodes.values()]
+    fig2.add_trace(go.Scattergl(x=xs, y=ys, mode="markers+text", text=list(nodes), textposition="middle center",
+                                marker=dict(size=160, color="lightblue", opacity=0.6), showlegend=False, hoverinfo='none'))
+
+    # 화살표 (선) 연결: 다섯 개 선분을 NaN으로 끊어서 하나의 트레이스로 그림
+    # 사다리->평행, 평행->직사, 평행->마름, 직사->정사, 마름->정사 순서
+    line_xs = np.array([0, 0, np.nan, 0, -0.9, np.nan, 0, 0.9, np.nan, -0.4, -0.05, np.nan, 0.4, 0.05])
+    line_ys = np.array([1.6, 1.1, np.nan, 0.6, 0.15, np.nan, 0.6, 0.15, np.nan, -0.2, -0.8, np.nan, -0.2, -0.8])
+    fig2.add_trace(go.Scattergl(x=line_xs, y=line_ys, mode="lines", line=dict(color="black"),
+                                showlegend=False, hoverinfo='none'))
+
+    return plot_shape(fig2)
+
+
+@st.cache_resource
+def make_quiz_fig(kind):
+    """퀴즈 1에 보여줄 도형 그림 (보기 종류별로 한 번만 생성, 동일한 그리기 함수 사용)"""
+    fig = go.Figure()
+    if kind == "삼각형":
+        pts = draw_triangle(4.0, 50, 60)
+        xs, ys = close_polyline(pts)
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', line=dict(color='royalblue', width=4)))
+    elif kind == "사각형":
+        pts = draw_rectangle(3.5, 2.0)
+        xs, ys = close_polyline(pts)
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', line=dict(color='seagreen', width=4)))
+    else:
+        add_circle(fig, 2.0, 'crimson', 4)
+    return plot_shape(fig)
+
+
+def init_quiz_state():
+    """점수와 문제별 제출 플래그(이름 맞추기, OX)를 세션 상태에 한 번에 초기화"""
+    state = st.session_state
+    state.setdefault('score', 0)
+    state.setdefault('total', 0)
+    state.setdefault('answered_name', False)
+    for key in _OX_KEYS:
+        state.setdefault(key, False)
 
 
 # --------------------------------------------------
@@ -121,9 +241,11 @@ def draw_circle(radius, num_points=80):
 # --------------------------------------------------
 
 tabs = st.tabs(["도형 탐험 🔍", "사각형의 족보 🧩", "퀴즈 ✅"])
+# 각 탭 내용은 st.fragment 함수로 분리: 한 탭에서 위젯을 조작하면 그 탭만 다시 실행돼요.
 
 # ------------------ 탭1: 도형 탐험 ------------------
-with tabs[0]:
+@st.fragment
+def explore_tab():
     st.header("도형을 직접 만져봐요! 🤗")
 
     # 좌우 레이아웃: 왼쪽 컨트롤, 오른쪽 그래프
@@ -140,6 +262,7 @@ with tabs[0]:
             base = st.slider("밑변 길이 (AB)", 0.5, 8.0, 4.0, step=0.1)
             alpha = st.slider("A 꼭짓점 각도 (°)", 5, 170, 50)
             beta = st.slider("B 꼭짓점 각도 (°)", 5, 170, 60)
+            params = (base, alpha, beta)
 
         # 사각형 옵션
         elif shape == "사각형(직사각형/평행사변형)":
@@ -148,34 +271,36 @@ with tabs[0]:
             width = st.slider("밑변 길이", 0.5, 8.0, 4.0, step=0.1)
             height = st.slider("높이", 0.5, 6.0, 2.5, step=0.1)
             angle = st.slider("기울기 각도 (°) - 평행사변형일 때", 0, 80, 20)
+            params = (quad_type, width, height, angle)
 
         # 원 옵션
         else:
             st.markdown("**반지름을 조절해요**")
             radius = st.slider("반지름", 0.5, 5.0, 2.0, step=0.1)
+            params = (radius,)
 
     with right:
-        # Plotly figure 생성
-        fig = go.Figure()
+        # 세션에 보관된 Figure를 재사용: 입력이 지난 실행과 같으면 그대로 보여주고,
+        # 바뀌었을 때만 모든 트레이스를 숨기고 데이터와 원 도형을 비운 뒤
+        # 선택한 도형의 트레이스만 좌표를 채워 다시 보이게 함
+        fig = get_explore_fig()
+        sig = (shape,) + params
+        redraw = st.session_state.get('tab1_sig') != sig
+        if redraw:
+            fig.update_traces(x=[], y=[], visible=False)
+            fig.layout.shapes = ()
 
         if shape == "삼각형":
             coords = draw_triangle(base, alpha, beta)
             if coords is None:
                 st.warning("삼각형이 성립하지 않아요. 각도를 조절해 주세요. 😅")
             else:
-                xs = [p[0] for p in coords] + [coords[0][0]]
-                ys = [p[1] for p in coords] + [coords[0][1]]
-                fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines+markers", fill="toself", name="triangle",
-                                         marker=dict(size=8, color="royalblue"), line=dict(color="royalblue", width=3)))
-
-                # 각 변의 길이 계산
-                def dist(p, q):
-                    return math.hypot(p[0] - q[0], p[1] - q[1])
+                if redraw:
+                    xs, ys = close_polyline(coords)
+                    fig.update_traces(x=xs, y=ys, visible=True, selector=dict(name="triangle"))
 
-                A, B, C = coords
-                AB = dist(A, B)
-                BC = dist(B, C)
-                CA = dist(C, A)
+                # 각 변의 길이 계산 (A→B, B→C, C→A 차이 벡터의 길이를 한 번에 구함)
+                AB, BC, CA = np.linalg.norm(np.diff(np.vstack([coords, coords[:1]]), axis=0), axis=1)
 
                 # 정보 표시
                 st.markdown("### 삼각형 정보")
@@ -201,10 +326,10 @@ with tabs[0]:
                 pts = draw_parallelogram(width, height, angle)
                 color = "purple"
 
-            xs = [p[0] for p in pts] + [pts[0][0]]
-            ys = [p[1] for p in pts] + [pts[0][1]]
-            fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines+markers", fill="toself",
-                                     marker=dict(size=8, color=color), line=dict(color=color, width=3)))
+            if redraw:
+                xs, ys = close_polyline(pts)
+                fig.update_traces(x=xs, y=ys, visible=True, marker_color=color, line_color=color,
+                                  selector=dict(name="quad"))
 
             st.markdown("### 사각형 정보")
             if quad_type == "직사각형":
@@ -218,111 +343,71 @@ with tabs[0]:
                 st.info("평행사변형은 마주보는 변이 서로 평행해요. 기울기를 0으로 하면 직사각형이에요.")
 
         else:  # 원
-            xs, ys = draw_circle(radius)
-            fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", line=dict(color="crimson", width=3)))
-            # 중심 표시
-            fig.add_trace(go.Scatter(x=[0], y=[0], mode="markers", marker=dict(size=8, color="crimson")))
+            if redraw:
+                add_circle(fig, radius, "crimson", 3)
+                # 중심 표시
+                fig.update_traces(x=[0], y=[0], visible=True, selector=dict(name="center"))
             st.markdown("### 원 정보")
             st.write(f"- 반지름: {radius:.2f}")
             st.info("원의 중심에서 반지름만큼 떨어진 점들이 모두 원 위에 있어요. 지름은 반지름의 2배예요.")
 
-        # 공통 레이아웃 적용
-        fig = plot_shape(fig)
+        # 선택한 도형을 다 채운 뒤에만 입력 값을 기록 (중간에 멈추면 다음 실행에서 다시 그림)
+        if redraw:
+            st.session_state['tab1_sig'] = sig
         st.plotly_chart(fig, use_container_width=True)
 
+
+with tabs[0]:
+    explore_tab()
+
 # ------------------ 탭2: 사각형의 족보 ------------------
-with tabs[1]:
+@st.fragment
+def genealogy_tab():
     st.header("사각형의 족보를 살펴봐요 🧭")
     st.markdown("사다리꼴 → 평행사변형 → 직사각형/마름모 → 정사각형의 포함 관계를 그림과 버튼으로 배워봐요.")
 
-    # 그림: 간단한 계층 다이어그램을 그립니다 (plotly annotations 사용)
-    fig2 = go.Figure()
-    # 네모 박스 위치 지정 (x, y 중앙)
-    nodes = {
-        "사다리꼴": (0, 2),
-        "평행사변형": (0, 1),
-        "직사각형": (-1, 0),
-        "마름모": (1, 0),
-        "정사각형": (0, -1),
-    }
-
-    # 박스와 텍스트 추가
-    for name, (x, y) in nodes.items():
-        fig2.add_trace(go.Scatter(x=[x], y=[y], mode="markers+text", text=[name], textposition="middle center",
-                                  marker=dict(size=160, color="lightblue", opacity=0.6), showlegend=False, hoverinfo='none'))
-
-    # 화살표 (선) 연결
-    fig2.add_shape(type="line", x0=0, y0=1.6, x1=0, y1=1.1, line=dict(color="black"))  # 사다리->평행
-    fig2.add_shape(type="line", x0=0, y0=0.6, x1=-0.9, y1=0.15, line=dict(color="black"))  # 평행->직사
-    fig2.add_shape(type="line", x0=0, y0=0.6, x1=0.9, y1=0.15, line=dict(color="black"))  # 평행->마름
-    fig2.add_shape(type="line", x0=-0.4, y0=-0.2, x1=-0.05, y1=-0.8, line=dict(color="black"))
-    fig2.add_shape(type="line", x0=0.4, y0=-0.2, x1=0.05, y1=-0.8, line=dict(color="black"))
-
-    fig2 = plot_shape(fig2)
-    st.plotly_chart(fig2, use_container_width=True)
+    # 그림: 간단한 계층 다이어그램 (내용이 바뀌지 않으므로 한 번만 만들어 재사용)
+    st.plotly_chart(build_genealogy_fig(), use_container_width=True)
 
     st.markdown("---")
     st.write("아래 버튼을 눌러서 왜 포함관계가 성립하는지 친절히 설명을 볼 수 있어요.")
 
     # 버튼형 인터랙션 (각 항목 클릭 시 설명 표시)
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        if st.button("사다리꼴 설명 🟩"):
-            st.success("사다리꼴은 한 쌍의 마주보는 변만 평행해요. 모든 평행사변형은 사다리꼴이 될 수 있어요.")
-    with col2:
-        if st.button("평행사변형 설명 🔷"):
-            st.success("평행사변형은 마주보는 두 쌍의 변이 모두 평행해요. 이 성질 때문에 조금 더 규칙적인 모양이에요.")
-    with col3:
-        if st.button("직사각형/마름모 설명 🔶"):
-            st.success("직사각형은 네 각이 모두 90°인 평행사변형이에요. 마름모는 네 변의 길이가 모두 같은 평행사변형이에요.")
-
-    if st.button("정사각형 설명 ✨"):
-        st.success("정사각형은 네 변의 길이가 모두 같고, 네 각이 모두 직각인 도형이에요. 그래서 직사각형이면서 마름모이기도 해요!")
+    for col, (label, text) in zip(st.columns(len(EXPLANATIONS)), EXPLANATIONS.items()):
+        with col:
+            if st.button(label):
+                st.success(text)
+
+
+with tabs[1]:
+    genealogy_tab()
 
 # ------------------ 탭3: 퀴즈 ------------------
-with tabs[2]:
+@st.fragment
+def quiz_tab():
     st.header("퀴즈로 배운 내용을 확인해봐요! 🎯")
     st.markdown("도형을 보고 이름을 맞히거나, 성질에 대한 OX 퀴즈를 풀어보세요.")
 
     # 세션 상태로 점수 추적 (중복 카운트 방지 플래그 포함)
-    if 'score' not in st.session_state:
-        st.session_state['score'] = 0
-    if 'total' not in st.session_state:
-        st.session_state['total'] = 0
-
+    init_quiz_state()
+    state = st.session_state
 
     # 퀴즈 1: 그림 보고 이름 맞추기 (삼각형/사각형/원)
     st.subheader("문제 1: 도형 이름 맞추기")
-    quiz_fig = go.Figure()
     # 간단히 랜덤으로 하나 보여주기
     quiz_choice = st.radio("보기", ["삼각형", "사각형", "원"], index=0, horizontal=True)
 
-    # 실제 그림 표시 (동일한 그리기 함수 사용)
-    if quiz_choice == "삼각형":
-        c = draw_triangle(4.0, 50, 60)
-        xs = [p[0] for p in c] + [c[0][0]]
-        ys = [p[1] for p in c] + [c[0][1]]
-        quiz_fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', line=dict(color='royalblue', width=4)))
-    elif quiz_choice == "사각형":
-        pts = draw_rectangle(3.5, 2.0)
-        xs = [p[0] for p in pts] + [pts[0][0]]
-        ys = [p[1] for p in pts] + [pts[0][1]]
-        quiz_fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', line=dict(color='seagreen', width=4)))
-    else:
-        xs, ys = draw_circle(2.0)
-        quiz_fig.add_trace(go.Scatter(x=xs, y=ys, mode='lines', line=dict(color='crimson', width=4)))
-
-    quiz_fig = plot_shape(quiz_fig)
-    st.plotly_chart(quiz_fig, use_container_width=True)
+    # 실제 그림 표시 (보기마다 한 번 만든 그림을 재사용)
+    st.plotly_chart(make_quiz_fig(quiz_choice), use_container_width=True)
 
     answer = st.selectbox("이 도형의 이름은 무엇일까요?", ["선택하세요", "삼각형", "사각형", "원"])
     if st.button("정답 확인 🔎"):
         # 중복 카운트 방지
-        if not st.session_state.get('answered_name', False):
-            st.session_state['total'] += 1
-            st.session_state['answered_name'] = True
+        if not state['answered_name']:
+            state['total'] += 1
+            state['answered_name'] = True
             if answer == quiz_choice:
-                st.session_state['score'] += 1
+                state['score'] += 1
                 st.success("참 잘했어요! 🎉 정답이에요!")
             else:
                 st.error("아쉽네요 😢 정답은 '%s'예요. 힌트: 모서리 개수를 세어보세요!" % quiz_choice)
@@ -333,24 +418,18 @@ with tabs[2]:
 
     # 퀴즈 2: OX 문제
     st.subheader("문제 2: 성질 OX 퀴즈")
-    ox_qs = [
-        ("정사각형은 항상 직사각형이다.", True, "정사각형은 네 각이 모두 직각이므로 직사각형이에요."),
-        ("모든 평행사변형은 사다리꼴이다.", True, "사다리꼴은 한 쌍만 평행해도 되므로, 평행사변형은 사다리꼴의 일종이에요."),
-        ("모든 마름모는 직사각형이다.", False, "마름모는 네 변의 길이가 같지만 각이 직각일 필요는 없어요.")
-    ]
-
-    for i, (q, correct, hint) in enumerate(ox_qs, 1):
+    for i, (q, correct, hint) in enumerate(OX_QS, 1):
         st.write(f"Q{i}. {q}")
         choice = st.radio(f"선택 {i}", ["O", "X"], key=f"ox{i}")
         if st.button(f"제출 {i}", key=f"submit{i}"):
             # 중복 카운트 방지
-            answered_key = f"answered_{i}"
-            if not st.session_state.get(answered_key, False):
-                st.session_state['total'] += 1
-                st.session_state[answered_key] = True
+            answered_key = _OX_KEYS[i - 1]
+            if not state[answered_key]:
+                state['total'] += 1
+                state[answered_key] = True
                 picked = True if choice == "O" else False
                 if picked == correct:
-                    st.session_state['score'] += 1
+                    state['score'] += 1
                     st.success("정답이에요! 잘 이해했어요 🎉")
                     st.caption(hint)
                 else:
@@ -360,10 +439,14 @@ with tabs[2]:
 
     st.markdown("---")
     # 점수 표시
-    st.info(f"현재 점수: {st.session_state['score']} / {st.session_state['total']}")
+    st.info(f"현재 점수: {state['score']} / {state['total']}")
     st.info("퀴즈를 통해 배운 내용을 다시 확인해보세요. 더 풀고 싶다면 도형 탐험 탭으로 돌아가세요! 😄")
 
 
+with tabs[2]:
+    quiz_tab()
+
+
 # --------------------------------------------------
 # 파일 끝: 간단한 실행 안내
 # --------------------------------------------------